@@ -1,7 +1,10 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks, Header
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict
+import asyncio
+import hashlib
+import json
 import logging
 import shutil
 from pathlib import Path
@@ -18,12 +21,24 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Idle interval after which an event stream sends a keep-alive comment
+SSE_KEEPALIVE_SECONDS = 15
+
 # Global instances
 processor = VideoProcessor()
-job_queue = JobQueue(max_workers=4)
 config_manager = ConfigManager()
 
 
+def record_job_duration(job: Job):
+    """Feed end-to-end durations of profile jobs back into the config manager."""
+    if job.profile:
+        duration = (job.completed_at - job.created_at).total_seconds()
+        config_manager.record_duration(job.profile, duration)
+
+
+job_queue = JobQueue(max_workers=4, on_job_completed=record_job_duration)
+
+
 class JobRequest(BaseModel):
     """Request model for creating a job."""
     input_file: str
@@ -143,7 +158,8 @@ async def create_job_from_profile(request: ProfileJobRequest):
             input_file=request.input_file,
             operation=profile["operation"],
             parameters=profile["parameters"],
-            output_file=request.output_file
+            output_file=request.output_file,
+            profile=request.profile
         )
 
         job_id = job_queue.add_job(job)
@@ -192,7 +208,8 @@ async def create_jobs_from_workflow(request: WorkflowJobRequest):
             job = Job(
                 input_file=request.input_file,
                 operation=profile["operation"],
-                parameters=profile["parameters"]
+                parameters=profile["parameters"],
+                profile=profile_name
             )
 
             job_id = job_queue.add_job(job)
@@ -213,17 +230,27 @@ async def create_jobs_from_workflow(request: WorkflowJobRequest):
 
 
 @app.get("/jobs/", response_model=List[dict])
-async def list_jobs(status: Optional[str] = None):
-    """List all jobs, optionally filtered by status."""
+async def list_jobs(status: Optional[str] = None, accept: Optional[str] = Header(None)):
+    """
+    List all jobs, optionally filtered by status.
+
+    Send `Accept: application/x-ndjson` to stream one JSON job per line.
+    """
     try:
+        status_enum = None
         if status:
             try:
                 status_enum = JobStatus(status)
-                return job_queue.get_jobs_by_status(status_enum)
             except ValueError:
                 raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
-        else:
-            return job_queue.get_all_jobs()
+
+        if accept and "application/x-ndjson" in accept:
+            lines = (json.dumps(job) + "\n" for job in job_queue.iter_jobs(status_enum))
+            return StreamingResponse(lines, media_type="application/x-ndjson")
+
+        if status_enum:
+            return job_queue.get_jobs_by_status(status_enum)
+        return job_queue.get_all_jobs()
 
     except HTTPException:
         raise
@@ -233,13 +260,52 @@ async def list_jobs(status: Optional[str] = None):
 
 
 @app.get("/jobs/{job_id}", response_model=dict)
-async def get_job(job_id: str):
-    """Get job details by ID."""
+async def get_job(job_id: str, if_none_match: Optional[str] = Header(None)):
+    """Get job details by ID. Supports conditional requests via ETag."""
+    job = job_queue.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    state = job.to_dict()
+    body = json.dumps(state, sort_keys=True)
+    etag = f'"{hashlib.sha1(body.encode()).hexdigest()}"'
+
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """Stream job state changes as server-sent events until the job finishes."""
     job = job_queue.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return job.to_dict()
+    finished = {JobStatus.COMPLETED.value, JobStatus.FAILED.value, JobStatus.CANCELLED.value}
+
+    async def events():
+        updates = job_queue.subscribe(job_id)
+        try:
+            state = job.to_dict()
+            yield f"data: {json.dumps(state)}\n\n"
+
+            while state["status"] not in finished:
+                try:
+                    state = await asyncio.wait_for(updates.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    # Comment line: keeps proxies open and surfaces dead clients
+                    yield ": keepalive\n\n"
+                    continue
+                # Coalesce bursts of progress updates into the latest state
+                while not updates.empty():
+                    state = updates.get_nowait()
+                yield f"data: {json.dumps(state)}\n\n"
+        finally:
+            job_queue.unsubscribe(job_id, updates)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
 
 
 @app.delete("/jobs/{job_id}")
@@ -294,6 +360,19 @@ async def get_profile(profile_name: str):
     }
 
 
+@app.get("/profiles/{profile_name}/duration", response_model=dict)
+async def get_profile_duration(profile_name: str):
+    """Get the observed job duration model (log-normal) for a profile."""
+    model = config_manager.get_duration_model(profile_name)
+    if not model:
+        raise HTTPException(status_code=404, detail="No duration history for profile")
+
+    return {
+        "name": profile_name,
+        **model
+    }
+
+
 @app.get("/workflows/", response_model=List[dict])
 async def list_workflows():
     """List all available workflows."""
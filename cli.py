@@ -5,34 +5,188 @@ Allows interaction with the API from command line
 """
 
 import argparse
-import requests
-import json
+import math
+import orjson
+import random
 import sys
+from collections import deque
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple
 import time
 
 
+TERMINAL_STATUSES = ('completed', 'failed', 'cancelled')
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Rows buffered per terminal write when listing jobs
+LIST_BATCH_SIZE = 100
+# Statuses that mean the server is overloaded and the request can be retried
+RETRY_STATUSES = (429, 503)
+# Attempts per request before giving up on an overloaded server
+MAX_ATTEMPTS = 5
+# Upper bound on a server-requested Retry-After wait, in seconds
+MAX_RETRY_AFTER = 60.0
+# Read timeout for event streams; the server sends keep-alives well within it
+STREAM_READ_TIMEOUT = 60.0
+
+
+def job_age(job: dict) -> float:
+    """
+    Seconds since a job was created, or 0 if its creation time is unknown.
+
+    Only timezone-aware timestamps are trusted, since naive ones from the
+    server and the CLI may be in different local times.
+    """
+    try:
+        created_at = datetime.fromisoformat(job['created_at'])
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+    if created_at.tzinfo is None:
+        return 0.0
+    return max(0.0, (datetime.now(timezone.utc) - created_at).total_seconds())
+
+
+def lognormal_poll_schedule(mu: float, sigma: float, budget: int = 15, quantile: float = 0.99) -> List[float]:
+    """
+    Compute poll times that minimize expected completion-detection delay.
+
+    The job duration is modeled as log-normal with parameters mu/sigma. Poll
+    times follow the recurrence
+        L_i = (F(L_{i-1}) - F(L_{i-2})) / p(L_{i-1}) + L_{i-1}
+    with L_0 = 0, and L_1 is chosen by bisection so that L_budget lands on
+    the given quantile of the distribution.
+    """
+    dist = NormalDist(mu, max(sigma, 0.05))
+    upper = math.exp(dist.inv_cdf(quantile))
+
+    def cdf(t: float) -> float:
+        return dist.cdf(math.log(t)) if t > 0 else 0.0
+
+    def pdf(t: float) -> float:
+        return dist.pdf(math.log(t)) / t if t > 0 else 0.0
+
+    def place(first: float) -> List[float]:
+        points = [0.0, first]
+        while len(points) <= budget:
+            density = pdf(points[-1])
+            if density <= 0:
+                return points[1:] + [math.inf]
+            points.append(points[-1] + (cdf(points[-1]) - cdf(points[-2])) / density)
+            if points[-1] > upper:
+                break
+        return points[1:]
+
+    low, high = 0.0, upper
+    for _ in range(60):
+        mid = (low + high) / 2
+        points = place(mid)
+        if len(points) < budget or points[-1] > upper:
+            high = mid
+        else:
+            low = mid
+
+    return [t for t in place(low) if t <= upper]
+
+
 class VideoProcessorCLI:
     """Command-line interface for the video processor."""
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        poll_min: float = 0.2,
+        poll_max: float = 10.0,
+        backoff_base: float = 1.3,
+        poll_budget: int = 15,
+        stall_timeout: float = 1800.0
+    ):
         self.base_url = base_url
+        self.poll_min = poll_min
+        self.poll_max = poll_max
+        self.backoff_base = backoff_base
+        self.poll_budget = poll_budget
+        self.stall_timeout = stall_timeout
+        self._session = None
+
+        # Last ETag and parsed body per job, for conditional GETs
+        self._etag_cache: Dict[str, Tuple[str, dict]] = {}
+
+    @property
+    def session(self):
+        """HTTP session, created on first use so requests is imported lazily."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            # Share one connection pool across calls so polling reuses connections
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        return self._session
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _retry_delay(self, response, delay: float) -> float:
+        """Seconds to wait before retrying, honoring the server's Retry-After."""
+        try:
+            value = float(response.headers.get("Retry-After", delay))
+        except ValueError:
+            return delay
+        return max(0.0, min(value, MAX_RETRY_AFTER))
+
+    def _request(self, method: str, url: str, **kwargs):
+        """Send a request, retrying with backoff while the server is overloaded."""
+        delay = self.poll_min
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_ATTEMPTS:
+                return response
+
+            response.close()
+            time.sleep(self._retry_delay(response, delay))
+            delay = min(delay * 2, self.poll_max)
+
+    async def _request_async(self, client, method: str, url: str, **kwargs):
+        """Async counterpart of _request for httpx clients."""
+        import asyncio
+
+        delay = self.poll_min
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            response = await client.request(method, url, **kwargs)
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_ATTEMPTS:
+                return response
+
+            await asyncio.sleep(self._retry_delay(response, delay))
+            delay = min(delay * 2, self.poll_max)
 
     def create_job(self, input_file: str, operation: str, parameters: dict, output_file: Optional[str] = None):
         """Create a new processing job."""
         try:
-            response = requests.post(
+            response = self._request(
+                "POST",
                 f"{self.base_url}/jobs/",
-                json={
+                data=orjson.dumps({
                     "input_file": input_file,
                     "operation": operation,
                     "parameters": parameters,
                     "output_file": output_file
-                }
+                }),
+                headers=JSON_HEADERS
             )
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✓ Job created: {result['job_id']}")
             return result['job_id']
         except Exception as e:
@@ -42,16 +196,18 @@ class VideoProcessorCLI:
     def create_job_from_profile(self, input_file: str, profile: str, output_file: Optional[str] = None):
         """Create a job using a profile."""
         try:
-            response = requests.post(
+            response = self._request(
+                "POST",
                 f"{self.base_url}/jobs/profile/",
-                json={
+                data=orjson.dumps({
                     "input_file": input_file,
                     "profile": profile,
                     "output_file": output_file
-                }
+                }),
+                headers=JSON_HEADERS
             )
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✓ Job created from profile '{profile}': {result['job_id']}")
             return result['job_id']
         except Exception as e:
@@ -61,18 +217,20 @@ class VideoProcessorCLI:
     def create_workflow(self, input_file: str, workflow: str):
         """Create jobs from a workflow."""
         try:
-            response = requests.post(
+            response = self._request(
+                "POST",
                 f"{self.base_url}/jobs/workflow/",
-                json={
+                data=orjson.dumps({
                     "input_file": input_file,
                     "workflow": workflow
-                }
+                }),
+                headers=JSON_HEADERS
             )
             response.raise_for_status()
-            result = response.json()
-            print(f"✓ Created {result['total_jobs']} jobs from workflow '{workflow}':")
-            for job in result['jobs']:
-                print(f"  - {job['job_id']} ({job['profile']})")
+            result = orjson.loads(response.content)
+            lines = [f"✓ Created {result['total_jobs']} jobs from workflow '{workflow}':"]
+            lines += [f"  - {job['job_id']} ({job['profile']})" for job in result['jobs']]
+            sys.stdout.write("\n".join(lines) + "\n")
             return [job['job_id'] for job in result['jobs']]
         except Exception as e:
             print(f"✗ Failed to create workflow: {e}")
@@ -81,9 +239,19 @@ class VideoProcessorCLI:
     def get_job(self, job_id: str):
         """Get job status."""
         try:
-            response = requests.get(f"{self.base_url}/jobs/{job_id}")
+            cached = self._etag_cache.get(job_id)
+            headers = {"If-None-Match": cached[0]} if cached else {}
+
+            response = self._request("GET", f"{self.base_url}/jobs/{job_id}", headers=headers)
+            if response.status_code == 304 and cached:
+                return cached[1]
             response.raise_for_status()
-            return response.json()
+
+            job = orjson.loads(response.content)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etag_cache[job_id] = (etag, job)
+            return job
         except Exception as e:
             print(f"✗ Failed to get job: {e}")
             sys.exit(1)
@@ -95,76 +263,310 @@ class VideoProcessorCLI:
             if status:
                 url += f"?status={status}"
 
-            response = requests.get(url)
-            response.raise_for_status()
-            jobs = response.json()
-
-            if not jobs:
+            headers = {"Accept": "application/x-ndjson"}
+            with self._request("GET", url, stream=True, headers=headers) as response:
+                response.raise_for_status()
+
+                # Print rows in small batches as they arrive instead of
+                # buffering the whole list
+                found = False
+                rows = []
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+
+                    if not found:
+                        rows.append(f"\n{'ID':<38} {'Status':<12} {'Operation':<20} {'Progress':<10}")
+                        rows.append("-" * 85)
+                        found = True
+
+                    job = orjson.loads(line)
+                    rows.append(
+                        f"{job['id']:<38} "
+                        f"{job['status']:<12} "
+                        f"{job['operation']:<20} "
+                        f"{job['progress']:.1f}%"
+                    )
+
+                    if len(rows) >= LIST_BATCH_SIZE:
+                        sys.stdout.write("\n".join(rows) + "\n")
+                        rows = []
+
+                if rows:
+                    sys.stdout.write("\n".join(rows) + "\n")
+
+            if not found:
                 print("No jobs found")
-                return
-
-            print(f"\n{'ID':<38} {'Status':<12} {'Operation':<20} {'Progress':<10}")
-            print("-" * 85)
-
-            for job in jobs:
-                print(
-                    f"{job['id']:<38} "
-                    f"{job['status']:<12} "
-                    f"{job['operation']:<20} "
-                    f"{job['progress']:.1f}%"
-                )
 
         except Exception as e:
             print(f"✗ Failed to list jobs: {e}")
             sys.exit(1)
 
+    def get_poll_schedule(self, job: dict) -> List[float]:
+        """Get adaptive poll times for a job from its profile's duration history."""
+        profile = job.get('profile')
+        if not profile:
+            return []
+
+        try:
+            response = self._request("GET", f"{self.base_url}/profiles/{profile}/duration")
+            if response.status_code != 200:
+                return []
+            model = orjson.loads(response.content)
+            return lognormal_poll_schedule(model['mu'], model['sigma'], self.poll_budget)
+        except Exception:
+            return []
+
+    def show_progress(self, job: dict) -> bool:
+        """Render a job's progress line, returning True once the job is finished."""
+        status_line = (
+            f"Status: {job['status']:<12} | "
+            f"Progress: {job['progress']:.1f}% | "
+            f"Operation: {job['operation']}"
+        )
+
+        if sys.stdout.isatty():
+            # Erase the current line and repaint it in place
+            sys.stdout.write("\x1b[2K\r" + status_line)
+            sys.stdout.flush()
+        else:
+            print(status_line)
+
+        if job['status'] not in TERMINAL_STATUSES:
+            return False
+
+        print("\n" if sys.stdout.isatty() else "")
+        if job['status'] == 'completed':
+            print(f"✓ Job completed successfully")
+            print(f"Output: {job['output_file']}")
+        elif job['status'] == 'failed':
+            print(f"✗ Job failed: {job.get('error', 'Unknown error')}")
+        else:
+            print(f"⚠ Job was cancelled")
+        return True
+
+    def abort_stalled(self, job_id: str):
+        """Stop watching a job whose progress has not moved within stall_timeout."""
+        print(f"\n\n⚠ Job {job_id} made no progress for {self.stall_timeout:.0f}s, stopped watching")
+        sys.exit(2)
+
+    def stream_job(self, job_id: str) -> bool:
+        """
+        Follow job progress over the server-sent events endpoint.
+
+        Returns False if the server does not offer the stream or it ends
+        before the job finishes, so the caller can fall back to polling.
+        """
+        from requests import RequestException
+
+        # The server sends keep-alive comments while a job is idle, so the
+        # stall check below runs even when no state events arrive
+        last_change = time.monotonic()
+        last_progress = None
+        last_status = None
+        url = f"{self.base_url}/jobs/{job_id}/events"
+
+        try:
+            with self._request("GET", url, stream=True, timeout=(10, STREAM_READ_TIMEOUT)) as response:
+                if response.status_code == 404:
+                    return False
+                response.raise_for_status()
+
+                for line in response.iter_lines(decode_unicode=True):
+                    if line and line.startswith("data:"):
+                        job = orjson.loads(line[5:])
+                        if self.show_progress(job):
+                            return True
+
+                        if job['progress'] != last_progress or job['status'] != last_status:
+                            last_change = time.monotonic()
+                        last_progress = job['progress']
+                        last_status = job['status']
+
+                    # Jobs still waiting in the queue are never treated as stalled
+                    if last_status == 'processing' and time.monotonic() - last_change > self.stall_timeout:
+                        self.abort_stalled(job_id)
+        except (RequestException, ValueError, KeyError):
+            # Dropped or silent connections and malformed events fall back
+            # to polling, which does its own stall tracking
+            pass
+
+        return False
+
+    def _next_delay(self, job: dict, last_status: Optional[str], delay: float) -> float:
+        """
+        Next poll delay for a job.
+
+        Polls quickly after a status change and backs off while the job
+        runs; ffmpeg reports progress every ~0.5s so it can't drive resets.
+        """
+        if job['status'] != last_status:
+            return self.poll_min
+        return min(delay * self.backoff_base, self.poll_max)
+
+    def _jittered(self, delay: float) -> float:
+        """Spread a delay by ±20% so concurrent watchers don't poll in lockstep."""
+        return delay * random.uniform(0.8, 1.2)
+
+    def poll_job(self, job_id: str):
+        """Follow job progress by polling the job endpoint."""
+        delay = self.poll_min
+        last_progress = None
+        last_status = None
+        stall_start = time.monotonic()
+        origin = None
+        schedule = None
+
+        while True:
+            job = self.get_job(job_id)
+
+            if schedule is None:
+                # Schedule offsets are measured from job creation, not from
+                # when watching started
+                origin = time.monotonic() - job_age(job)
+                schedule = deque(self.get_poll_schedule(job))
+
+            delay = self._next_delay(job, last_status, delay)
+
+            if job['progress'] != last_progress or job['status'] != last_status:
+                stall_start = time.monotonic()
+            last_progress = job['progress']
+            last_status = job['status']
+
+            # Give up on jobs whose progress is frozen while processing
+            if job['status'] == 'processing' and time.monotonic() - stall_start > self.stall_timeout:
+                self.abort_stalled(job_id)
+
+            if self.show_progress(job):
+                break
+
+            # The backoff bounds every wait; the adaptive schedule only adds
+            # extra polls where completion is most likely
+            elapsed = time.monotonic() - origin
+            while schedule and schedule[0] <= elapsed:
+                schedule.popleft()
+
+            sleep_for = self._jittered(delay)
+            if schedule:
+                sleep_for = min(sleep_for, schedule[0] - elapsed)
+            time.sleep(sleep_for)
+
     def watch_job(self, job_id: str):
         """Watch job progress in real-time."""
         print(f"Watching job {job_id}...")
         print("Press Ctrl+C to stop watching\n")
 
         try:
-            while True:
-                job = self.get_job(job_id)
-
-                # Clear line and print status
-                sys.stdout.write('\r' + ' ' * 100 + '\r')
-                sys.stdout.write(
-                    f"Status: {job['status']:<12} | "
-                    f"Progress: {job['progress']:.1f}% | "
-                    f"Operation: {job['operation']}"
-                )
-                sys.stdout.flush()
-
-                if job['status'] in ['completed', 'failed', 'cancelled']:
-                    print("\n")
-                    if job['status'] == 'completed':
-                        print(f"✓ Job completed successfully")
-                        print(f"Output: {job['output_file']}")
-                    elif job['status'] == 'failed':
-                        print(f"✗ Job failed: {job.get('error', 'Unknown error')}")
-                    else:
-                        print(f"⚠ Job was cancelled")
-                    break
-
-                time.sleep(1)
+            if not self.stream_job(job_id):
+                self.poll_job(job_id)
 
         except KeyboardInterrupt:
             print("\n\nStopped watching")
 
+    async def _watch_job_async(self, client, job_id: str) -> dict:
+        """
+        Poll a single job with jittered backoff until it finishes.
+
+        Returns the last job state seen; it is still non-terminal if the job
+        stalled past stall_timeout and watching it was given up.
+        """
+        import asyncio
+
+        delay = self.poll_min
+        last_progress = None
+        last_status = None
+        stall_start = time.monotonic()
+
+        while True:
+            response = await self._request_async(client, "GET", f"/jobs/{job_id}")
+            response.raise_for_status()
+            job = orjson.loads(response.content)
+
+            if job['status'] in TERMINAL_STATUSES:
+                symbol = {'completed': '✓', 'failed': '✗'}.get(job['status'], '⚠')
+                print(f"{symbol} {job_id} ({job['operation']}): {job['status']}")
+                return job
+
+            delay = self._next_delay(job, last_status, delay)
+
+            if job['progress'] != last_progress or job['status'] != last_status:
+                stall_start = time.monotonic()
+            last_progress = job['progress']
+            last_status = job['status']
+
+            if job['status'] == 'processing' and time.monotonic() - stall_start > self.stall_timeout:
+                print(f"⚠ {job_id} ({job['operation']}): no progress for {self.stall_timeout:.0f}s, stopped watching")
+                return job
+
+            await asyncio.sleep(self._jittered(delay))
+
+    async def _watch_jobs_async(self, job_ids: List[str]) -> list:
+        """
+        Watch several jobs concurrently over a small shared connection pool.
+
+        Returns one entry per job: its last state, or the exception that
+        stopped watching it.
+        """
+        import asyncio
+        import httpx
+
+        # Keep-alive connections are reused across polls; no pool timeout so
+        # large workflows can wait their turn for a connection
+        limits = httpx.Limits(max_connections=4)
+        timeout = httpx.Timeout(10, pool=None)
+        async with httpx.AsyncClient(base_url=self.base_url, limits=limits, timeout=timeout) as client:
+            return await asyncio.gather(
+                *(self._watch_job_async(client, job_id) for job_id in job_ids),
+                return_exceptions=True
+            )
+
+    def watch_jobs(self, job_ids: List[str]):
+        """Watch multiple jobs concurrently until all of them finish."""
+        # Imported lazily: only 'workflow --watch' needs an event loop
+        import asyncio
+
+        print(f"\nWatching {len(job_ids)} jobs...")
+        print("Press Ctrl+C to stop watching\n")
+
+        try:
+            results = asyncio.run(self._watch_jobs_async(job_ids))
+
+            jobs = []
+            errors = 0
+            for job_id, result in zip(job_ids, results):
+                if isinstance(result, Exception):
+                    print(f"✗ {job_id}: failed to watch: {result}")
+                    errors += 1
+                else:
+                    jobs.append(result)
+
+            completed = sum(1 for job in jobs if job['status'] == 'completed')
+            print(f"\n{completed}/{len(job_ids)} jobs completed successfully")
+
+            if errors:
+                sys.exit(1)
+            if any(job['status'] not in TERMINAL_STATUSES for job in jobs):
+                sys.exit(2)
+
+        except KeyboardInterrupt:
+            print("\n\nStopped watching")
+        except Exception as e:
+            print(f"✗ Failed to watch jobs: {e}")
+            sys.exit(1)
+
     def list_profiles(self):
         """List available profiles."""
         try:
-            response = requests.get(f"{self.base_url}/profiles/")
+            response = self._request("GET", f"{self.base_url}/profiles/")
             response.raise_for_status()
-            profiles = response.json()
+            profiles = orjson.loads(response.content)
 
-            print("\nAvailable Profiles:")
-            print("-" * 80)
+            lines = ["\nAvailable Profiles:", "-" * 80]
             for profile in profiles:
-                print(f"\n{profile['name']}")
-                print(f"  Operation: {profile['operation']}")
-                print(f"  Description: {profile['description']}")
+                lines.append(f"\n{profile['name']}")
+                lines.append(f"  Operation: {profile['operation']}")
+                lines.append(f"  Description: {profile['description']}")
+            sys.stdout.write("\n".join(lines) + "\n")
 
         except Exception as e:
             print(f"✗ Failed to list profiles: {e}")
@@ -173,16 +575,16 @@ class VideoProcessorCLI:
     def list_workflows(self):
         """List available workflows."""
         try:
-            response = requests.get(f"{self.base_url}/workflows/")
+            response = self._request("GET", f"{self.base_url}/workflows/")
             response.raise_for_status()
-            workflows = response.json()
+            workflows = orjson.loads(response.content)
 
-            print("\nAvailable Workflows:")
-            print("-" * 80)
+            lines = ["\nAvailable Workflows:", "-" * 80]
             for workflow in workflows:
-                print(f"\n{workflow['name']}")
-                print(f"  Description: {workflow['description']}")
-                print(f"  Jobs: {workflow['jobs']}")
+                lines.append(f"\n{workflow['name']}")
+                lines.append(f"  Description: {workflow['description']}")
+                lines.append(f"  Jobs: {workflow['jobs']}")
+            sys.stdout.write("\n".join(lines) + "\n")
 
         except Exception as e:
             print(f"✗ Failed to list workflows: {e}")
@@ -191,26 +593,55 @@ class VideoProcessorCLI:
     def get_stats(self):
         """Get processing statistics."""
         try:
-            response = requests.get(f"{self.base_url}/stats/")
+            response = self._request("GET", f"{self.base_url}/stats/")
             response.raise_for_status()
-            stats = response.json()
-
-            print("\nProcessing Statistics:")
-            print("-" * 40)
-            print(f"Total Jobs: {stats['queue']['total_jobs']}")
-            print(f"Completed: {stats['queue']['completed_jobs']}")
-            print(f"Failed: {stats['queue']['failed_jobs']}")
-            print(f"Processing: {stats['queue']['processing_jobs']}")
-            print(f"Queue Size: {stats['queue']['queue_size']}")
-            print(f"Active Workers: {stats['queue']['active_workers']}")
-            print(f"\nProfiles: {stats['profiles']}")
-            print(f"Workflows: {stats['workflows']}")
+            stats = orjson.loads(response.content)
+
+            lines = [
+                "\nProcessing Statistics:",
+                "-" * 40,
+                f"Total Jobs: {stats['queue']['total_jobs']}",
+                f"Completed: {stats['queue']['completed_jobs']}",
+                f"Failed: {stats['queue']['failed_jobs']}",
+                f"Processing: {stats['queue']['processing_jobs']}",
+                f"Queue Size: {stats['queue']['queue_size']}",
+                f"Active Workers: {stats['queue']['active_workers']}",
+                f"\nProfiles: {stats['profiles']}",
+                f"Workflows: {stats['workflows']}"
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
 
         except Exception as e:
             print(f"✗ Failed to get stats: {e}")
             sys.exit(1)
 
 
+def run_create(args, cli: VideoProcessorCLI):
+    """Create a job and watch it."""
+    params = orjson.loads(args.params)
+    job_id = cli.create_job(args.input, args.operation, params, args.output)
+    cli.watch_job(job_id)
+
+
+def run_profile(args, cli: VideoProcessorCLI):
+    """Create a job from a profile and watch it."""
+    job_id = cli.create_job_from_profile(args.input, args.profile, args.output)
+    cli.watch_job(job_id)
+
+
+def run_workflow(args, cli: VideoProcessorCLI):
+    """Create jobs from a workflow, optionally watching them all."""
+    job_ids = cli.create_workflow(args.input, args.workflow)
+    if args.watch and job_ids:
+        cli.watch_jobs(job_ids)
+
+
+def run_status(args, cli: VideoProcessorCLI):
+    """Print a job as JSON."""
+    job = cli.get_job(args.job_id)
+    print(orjson.dumps(job, option=orjson.OPT_INDENT_2).decode())
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -224,6 +655,13 @@ def main():
         help="API base URL (default: http://localhost:8000)"
     )
 
+    parser.add_argument(
+        "--stall-timeout",
+        type=float,
+        default=1800.0,
+        help="Stop watching (exit code 2) after this many seconds without progress (default: 1800)"
+    )
+
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # Create job command
@@ -232,38 +670,48 @@ def main():
     create_parser.add_argument("operation", help="Operation to perform")
     create_parser.add_argument("--output", help="Output file path")
     create_parser.add_argument("--params", help="Parameters as JSON string", default="{}")
+    create_parser.set_defaults(func=run_create)
 
     # Profile command
     profile_parser = subparsers.add_parser("profile", help="Create job from profile")
     profile_parser.add_argument("input", help="Input video file path")
     profile_parser.add_argument("profile", help="Profile name")
     profile_parser.add_argument("--output", help="Output file path")
+    profile_parser.set_defaults(func=run_profile)
 
     # Workflow command
     workflow_parser = subparsers.add_parser("workflow", help="Create jobs from workflow")
     workflow_parser.add_argument("input", help="Input video file path")
     workflow_parser.add_argument("workflow", help="Workflow name")
+    workflow_parser.add_argument("--watch", action="store_true", help="Watch all created jobs until they finish")
+    workflow_parser.set_defaults(func=run_workflow)
 
     # Status command
     status_parser = subparsers.add_parser("status", help="Get job status")
     status_parser.add_argument("job_id", help="Job ID")
+    status_parser.set_defaults(func=run_status)
 
     # List command
     list_parser = subparsers.add_parser("list", help="List jobs")
     list_parser.add_argument("--status", help="Filter by status")
+    list_parser.set_defaults(func=lambda args, cli: cli.list_jobs(args.status))
 
     # Watch command
     watch_parser = subparsers.add_parser("watch", help="Watch job progress")
     watch_parser.add_argument("job_id", help="Job ID")
+    watch_parser.set_defaults(func=lambda args, cli: cli.watch_job(args.job_id))
 
     # Profiles command
-    subparsers.add_parser("profiles", help="List available profiles")
+    profiles_parser = subparsers.add_parser("profiles", help="List available profiles")
+    profiles_parser.set_defaults(func=lambda args, cli: cli.list_profiles())
 
     # Workflows command
-    subparsers.add_parser("workflows", help="List available workflows")
+    workflows_parser = subparsers.add_parser("workflows", help="List available workflows")
+    workflows_parser.set_defaults(func=lambda args, cli: cli.list_workflows())
 
     # Stats command
-    subparsers.add_parser("stats", help="Show processing statistics")
+    stats_parser = subparsers.add_parser("stats", help="Show processing statistics")
+    stats_parser.set_defaults(func=lambda args, cli: cli.get_stats())
 
     args = parser.parse_args()
 
@@ -271,39 +719,9 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    cli = VideoProcessorCLI(base_url=args.url)
-
-    # Execute command
-    if args.command == "create":
-        params = json.loads(args.params)
-        job_id = cli.create_job(args.input, args.operation, params, args.output)
-        cli.watch_job(job_id)
-
-    elif args.command == "profile":
-        job_id = cli.create_job_from_profile(args.input, args.profile, args.output)
-        cli.watch_job(job_id)
-
-    elif args.command == "workflow":
-        job_ids = cli.create_workflow(args.input, args.workflow)
-
-    elif args.command == "status":
-        job = cli.get_job(args.job_id)
-        print(json.dumps(job, indent=2))
-
-    elif args.command == "list":
-        cli.list_jobs(args.status)
-
-    elif args.command == "watch":
-        cli.watch_job(args.job_id)
-
-    elif args.command == "profiles":
-        cli.list_profiles()
-
-    elif args.command == "workflows":
-        cli.list_workflows()
-
-    elif args.command == "stats":
-        cli.get_stats()
+    # One client (and connection pool) serves the whole command
+    with VideoProcessorCLI(base_url=args.url, stall_timeout=args.stall_timeout) as cli:
+        args.func(args, cli)
 
 
 if __name__ == "__main__":
@@ -1,32 +1,60 @@
-import yaml
+import json
+import math
+import pickle
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Smoothing factor for the per-profile job duration EWMA
+DURATION_EWMA_ALPHA = 0.2
+# Samples needed before a profile's duration model is considered usable
+DURATION_MIN_SAMPLES = 3
+
+_REQUIRED_PROFILE_FIELDS = frozenset({"operation", "parameters"})
+
 
 class ConfigManager:
     """Manages configuration profiles and workflows."""
 
     def __init__(self, config_path: str = "config/profiles.yaml"):
         self.config_path = Path(config_path)
+        self.cache_path = self.config_path.with_suffix(".yaml.pkl")
+        self.durations_path = self.config_path.with_name("durations.json")
         self.profiles = {}
         self.workflows = {}
+        self.durations = {}
+        self._profiles_list_cache: Optional[List[Dict]] = None
+        self._workflows_list_cache: Optional[List[Dict]] = None
         self.load_config()
+        self.load_durations()
 
     def load_config(self):
         """Load configuration from YAML file."""
+        self._invalidate_list_caches()
+
         try:
             if not self.config_path.exists():
                 logger.warning(f"Config file not found: {self.config_path}")
                 return
 
+            if self._load_cache():
+                logger.info(
+                    f"Loaded {len(self.profiles)} profiles and {len(self.workflows)} workflows (cached)"
+                )
+                return
+
+            # Imported lazily: a fresh cache means YAML is never needed
+            import yaml
+
+            # Prefer the libyaml-backed loader when PyYAML was built with it
             with open(self.config_path, "r") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
             self.profiles = config.get("profiles", {})
             self.workflows = config.get("workflows", {})
+            self._write_cache()
 
             logger.info(
                 f"Loaded {len(self.profiles)} profiles and {len(self.workflows)} workflows"
@@ -35,6 +63,30 @@ class ConfigManager:
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
 
+    def _load_cache(self) -> bool:
+        """Load profiles and workflows from the parsed-config cache if it is fresh."""
+        try:
+            if not self.cache_path.exists():
+                return False
+            if self.cache_path.stat().st_mtime < self.config_path.stat().st_mtime:
+                return False
+
+            with open(self.cache_path, "rb") as f:
+                self.profiles, self.workflows = pickle.load(f)
+            return True
+
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable config cache: {e}")
+            return False
+
+    def _write_cache(self):
+        """Write parsed profiles and workflows next to the YAML file."""
+        try:
+            with open(self.cache_path, "wb") as f:
+                pickle.dump((self.profiles, self.workflows), f)
+        except Exception as e:
+            logger.warning(f"Failed to write config cache: {e}")
+
     def get_profile(self, profile_name: str) -> Optional[Dict]:
         """Get a processing profile by name."""
         profile = self.profiles.get(profile_name)
@@ -49,36 +101,41 @@ class ConfigManager:
             logger.warning(f"Workflow not found: {workflow_name}")
         return workflow
 
+    def _invalidate_list_caches(self):
+        """Drop precomputed profile and workflow listings."""
+        self._profiles_list_cache = None
+        self._workflows_list_cache = None
+
     def list_profiles(self) -> List[Dict]:
         """List all available profiles."""
-        return [
-            {
-                "name": name,
-                "operation": profile.get("operation"),
-                "description": profile.get("description", "")
-            }
-            for name, profile in self.profiles.items()
-        ]
+        if self._profiles_list_cache is None:
+            self._profiles_list_cache = [
+                {
+                    "name": name,
+                    "operation": profile.get("operation"),
+                    "description": profile.get("description", "")
+                }
+                for name, profile in self.profiles.items()
+            ]
+        return self._profiles_list_cache
 
     def list_workflows(self) -> List[Dict]:
         """List all available workflows."""
-        return [
-            {
-                "name": name,
-                "description": workflow.get("description", ""),
-                "jobs": len(workflow.get("jobs", []))
-            }
-            for name, workflow in self.workflows.items()
-        ]
+        if self._workflows_list_cache is None:
+            self._workflows_list_cache = [
+                {
+                    "name": name,
+                    "description": workflow.get("description", ""),
+                    "jobs": len(workflow.get("jobs", []))
+                }
+                for name, workflow in self.workflows.items()
+            ]
+        return self._workflows_list_cache
 
     def validate_profile(self, profile_name: str) -> bool:
         """Validate that a profile exists and has required fields."""
-        profile = self.get_profile(profile_name)
-        if not profile:
-            return False
-
-        required_fields = ["operation", "parameters"]
-        return all(field in profile for field in required_fields)
+        profile = self.profiles.get(profile_name)
+        return profile is not None and _REQUIRED_PROFILE_FIELDS <= profile.keys()
 
     def create_custom_profile(
         self,
@@ -94,6 +151,7 @@ class ConfigManager:
                 "parameters": parameters,
                 "description": description
             }
+            self._invalidate_list_caches()
 
             logger.info(f"Created custom profile: {name}")
             return True
@@ -102,16 +160,85 @@ class ConfigManager:
             logger.error(f"Failed to create profile: {e}")
             return False
 
+    def load_durations(self):
+        """Load recorded per-profile job durations from file."""
+        try:
+            if not self.durations_path.exists():
+                return
+
+            with open(self.durations_path, "r") as f:
+                self.durations = json.load(f)
+
+            logger.info(f"Loaded duration history for {len(self.durations)} profiles")
+
+        except Exception as e:
+            logger.error(f"Failed to load durations: {e}")
+
+    def record_duration(self, profile_name: str, seconds: float):
+        """
+        Record an observed job duration for a profile.
+
+        Durations are tracked as an EWMA of the mean and variance of
+        log(seconds), i.e. the parameters of a log-normal distribution.
+        """
+        if seconds <= 0:
+            return
+
+        x = math.log(seconds)
+        stats = self.durations.get(profile_name)
+
+        if not stats:
+            stats = {"mu": x, "var": 0.0, "samples": 0}
+        else:
+            diff = x - stats["mu"]
+            stats["mu"] += DURATION_EWMA_ALPHA * diff
+            stats["var"] = (1 - DURATION_EWMA_ALPHA) * (
+                stats["var"] + DURATION_EWMA_ALPHA * diff * diff
+            )
+
+        stats["samples"] += 1
+        self.durations[profile_name] = stats
+
+        try:
+            with open(self.durations_path, "w") as f:
+                json.dump(self.durations, f, indent=2)
+        except Exception as e:
+            logger.error(f"Failed to save durations: {e}")
+
+    def get_duration_model(self, profile_name: str) -> Optional[Dict]:
+        """Get the log-normal duration model for a profile, if enough samples exist."""
+        stats = self.durations.get(profile_name)
+        if not stats or stats["samples"] < DURATION_MIN_SAMPLES:
+            return None
+
+        return {
+            "mu": stats["mu"],
+            "sigma": math.sqrt(stats["var"]),
+            "samples": stats["samples"]
+        }
+
     def save_config(self):
         """Save current configuration to file."""
+        self._invalidate_list_caches()
+
         try:
             config = {
                 "profiles": self.profiles,
                 "workflows": self.workflows
             }
 
+            import yaml
+
             with open(self.config_path, "w") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    config,
+                    f,
+                    Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                    default_flow_style=False,
+                    sort_keys=False
+                )
+
+            self._write_cache()
 
             logger.info(f"Configuration saved to {self.config_path}")
 
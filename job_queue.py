@@ -1,8 +1,8 @@
 import asyncio
 import uuid
 import logging
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+from datetime import datetime, timezone
 from pathlib import Path
 from enum import Enum
 import json
@@ -26,16 +26,18 @@ class Job:
         input_file: str,
         operation: str,
         parameters: Dict,
-        output_file: Optional[str] = None
+        output_file: Optional[str] = None,
+        profile: Optional[str] = None
     ):
         self.id = str(uuid.uuid4())
         self.input_file = input_file
         self.output_file = output_file or self._generate_output_path(input_file, operation)
         self.operation = operation
         self.parameters = parameters
+        self.profile = profile
         self.status = JobStatus.PENDING
         self.progress = 0.0
-        self.created_at = datetime.now()
+        self.created_at = datetime.now(timezone.utc)
         self.started_at = None
         self.completed_at = None
         self.error = None
@@ -64,6 +66,7 @@ class Job:
             "output_file": self.output_file,
             "operation": self.operation,
             "parameters": self.parameters,
+            "profile": self.profile,
             "status": self.status.value,
             "progress": self.progress,
             "created_at": self.created_at.isoformat(),
@@ -77,9 +80,11 @@ class Job:
 class JobQueue:
     """Manages job queue and batch processing."""
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, on_job_completed: Optional[Callable[[Job], None]] = None):
         self.max_workers = max_workers
+        self.on_job_completed = on_job_completed
         self.jobs: Dict[str, Job] = {}
+        self.subscribers: Dict[str, List[asyncio.Queue]] = {}
         self.queue: asyncio.Queue = asyncio.Queue()
         self.workers: List[asyncio.Task] = []
         self.running = False
@@ -114,15 +119,46 @@ class JobQueue:
             if job.status == status
         ]
 
+    def iter_jobs(self, status: Optional[JobStatus] = None) -> Iterator[Dict]:
+        """Lazily yield jobs, optionally filtered by status."""
+        for job in list(self.jobs.values()):
+            if status is None or job.status == status:
+                yield job.to_dict()
+
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a pending job."""
         job = self.jobs.get(job_id)
         if job and job.status == JobStatus.PENDING:
             job.status = JobStatus.CANCELLED
+            self._notify(job)
             logger.info(f"Job {job_id} cancelled")
             return True
         return False
 
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        """Subscribe to state updates for a job."""
+        updates: asyncio.Queue = asyncio.Queue()
+        self.subscribers.setdefault(job_id, []).append(updates)
+        return updates
+
+    def unsubscribe(self, job_id: str, updates: asyncio.Queue):
+        """Remove a job state subscription."""
+        queues = self.subscribers.get(job_id, [])
+        if updates in queues:
+            queues.remove(updates)
+        if not queues:
+            self.subscribers.pop(job_id, None)
+
+    def _notify(self, job: Job):
+        """Push the current job state to all of its subscribers."""
+        queues = self.subscribers.get(job.id)
+        if not queues:
+            return
+
+        state = job.to_dict()
+        for updates in queues:
+            updates.put_nowait(state)
+
     async def start(self, processor):
         """Start the job queue workers."""
         if self.running:
@@ -183,15 +219,22 @@ class JobQueue:
     async def _process_job(self, worker_id: int, job: Job, processor):
         """Process a single job."""
         job.status = JobStatus.PROCESSING
-        job.started_at = datetime.now()
+        job.started_at = datetime.now(timezone.utc)
         self.stats["processing_jobs"] += 1
+        self._notify(job)
 
         logger.info(f"Worker {worker_id} processing job {job.id}: {job.operation}")
 
+        loop = asyncio.get_event_loop()
+
         try:
-            # Progress callback
+            # Progress callback, invoked from the executor thread
             def update_progress(progress: float):
+                if progress == job.progress:
+                    return
                 job.progress = progress
+                if self.subscribers.get(job.id):
+                    loop.call_soon_threadsafe(self._notify, job)
 
             # Execute the operation
             operation_func = getattr(processor, job.operation, None)
@@ -199,7 +242,6 @@ class JobQueue:
                 raise ValueError(f"Unknown operation: {job.operation}")
 
             # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
                 None,
                 lambda: operation_func(
@@ -226,8 +268,15 @@ class JobQueue:
             logger.error(f"Job {job.id} failed: {e}")
 
         finally:
-            job.completed_at = datetime.now()
+            job.completed_at = datetime.now(timezone.utc)
             self.stats["processing_jobs"] -= 1
+            self._notify(job)
+
+        if job.status == JobStatus.COMPLETED and self.on_job_completed:
+            try:
+                self.on_job_completed(job)
+            except Exception as e:
+                logger.error(f"Job completion hook failed for {job.id}: {e}")
 
     def get_stats(self) -> Dict:
         """Get queue statistics."""
@@ -4,21 +4,33 @@ FFmpeg Batch Video Processor
 Main application entry point
 """
 
-import uvicorn
 import logging
+import queue
 import sys
 import os
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('/data/logs/processor.log')
-    ]
+# Setup logging: records are queued on the calling thread and written to
+# stdout and the log file by a background listener thread
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setFormatter(formatter)
+
+file_handler = RotatingFileHandler(
+    '/data/logs/processor.log',
+    maxBytes=10 * 1024 * 1024,
+    backupCount=5
 )
+file_handler.setFormatter(formatter)
+
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, stream_handler, file_handler)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(QueueHandler(log_queue))
 
 logger = logging.getLogger(__name__)
 
@@ -32,12 +44,25 @@ def ensure_directories():
     ]
 
     for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
-        logger.info(f"Directory ready: {directory}")
+        path = Path(directory)
+        if not path.exists():
+            path.mkdir(parents=True, exist_ok=True)
+            logger.debug(f"Created {directory}")
+
+    logger.info(f"Directories ready: {', '.join(directories)}")
 
 
 def main():
     """Main application entry point."""
+    log_listener.start()
+    try:
+        run()
+    finally:
+        log_listener.stop()
+
+
+def run():
+    """Start the API server."""
     logger.info("=" * 60)
     logger.info("FFmpeg Batch Video Processor")
     logger.info("=" * 60)
@@ -54,12 +79,16 @@ def main():
     logger.info(f"Max workers: {workers}")
 
     # Start the API server
+    import uvicorn
+
     uvicorn.run(
         "api:app",
         host=host,
         port=port,
         log_level="info",
-        access_log=True
+        access_log=True,
+        # Don't let attached event streams block shutdown indefinitely
+        timeout_graceful_shutdown=10
     )
 
 